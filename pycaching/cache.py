@@ -2,19 +2,91 @@
 
 import logging
 import datetime
+import time
 import re
+import sys
 import enum
-import os
-from bs4.element import Script
+import functools
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from lxml import etree
 from pycaching import errors
 from pycaching.geo import Point
 from pycaching.trackable import Trackable
 from pycaching.log import Log, Type as LogType
-from pycaching.util import parse_date, rot13, lazy_loaded
+from pycaching.util import parse_date, rot13
 
 # prefix _type() function to avoid collisions with cache type
 _type = type
 
+# log types which mark a cache as found
+_FOUND_LOG_TYPES = (LogType.found_it, LogType.attended)
+
+# maps lowercase hex digits to 0x01 and every other byte to 0x00, used for GUID validation
+_GUID_HEX_TABLE = bytes(byte in b"0123456789abcdef" for byte in range(256))
+
+# patterns used while parsing cache pages, compiled once on import
+_USER_TOKEN_RE = re.compile(r"userToken\s*=\s*'([^']+)'")
+_OLD_LATLNG_RE = re.compile(r'oldLatLng":\s*\[([^\]]+)\]')
+_ATTR_SRC_RE = re.compile(r"/attributes/")
+_CONTAINER_SRC_RE = re.compile(r"/icons/container/")
+# "/images/attributes/s-tool-yes.png" -> ("s-tool", "yes"), blank attributes don't match
+_ATTR_NAME_RE = re.compile(r"([^/]+)-(yes|no)\.")
+_PLACED_BY_RE = re.compile(r"Placed by:")
+_PLACED_DATE_RE = re.compile(r"Placed Date:")
+_FAVORITES_RE = re.compile(r"Favorites:")
+# waypoint coordinates start like "N 49° 57.895", hidden ones are shown as "???"
+_WAYPOINT_COORDS_RE = re.compile(r"[NS]\s*\d")
+# rows of a waypoints table (directly or in its sections) in document order, see Waypoint.from_lxml()
+_WAYPOINT_ROWS_XPATH = etree.XPath("(.//table[@id=$id])[1]/tr | (.//table[@id=$id])[1]/*/tr")
+
+# the only parts of log page needed for posting a log, matched directly on the lxml tree
+_LOG_TYPES_XPATH = etree.XPath("//select[@name='LogTypeId']//option/@value")
+_LOG_INPUTS_XPATH = etree.XPath("//input[@name and (@type='hidden' or @type='submit')]")
+
+
+def _is_guid(guid):
+    """Return whether a string is a lowercase GUID, eg. "53d34c4d-12b5-4771-86d3-89318f71efb1"."""
+    try:
+        raw = guid.encode("ascii")
+    except UnicodeEncodeError:
+        return False
+    if len(raw) != 36 or raw[8] != 0x2d or raw[13] != 0x2d or raw[18] != 0x2d or raw[23] != 0x2d:
+        return False
+    # strip the dashes, the remaining 32 characters must all be hex digits
+    return raw.translate(_GUID_HEX_TABLE, b"-") == b"\x01" * 32
+
+
+def _basename_noext(url):
+    """Return a filename without extension from URL, eg. "../images/logtypes/2.png" -> "2"."""
+    filename = url.rpartition("/")[2]
+    return filename.rpartition(".")[0] or filename
+
+
+def _child_tags(tag, name):
+    """Return a list of direct children of a tag having the given tag name."""
+    return [child for child in tag.children if child.name == name]
+
+
+def _table_rows(table):
+    """Generate rows of a table in document order.
+
+    Rows are direct children of the table or its sections, so there is no need for recursive search.
+    """
+    for child in table.children:
+        if child.name == "tr":
+            yield child
+        elif child.name in ("thead", "tbody", "tfoot"):
+            yield from _child_tags(child, "tr")
+
+
+def _cell_text(tag):
+    """Return stripped text of a tag, reading its only string directly if there is just one."""
+    text = tag.string
+    if text is None:  # more children, concatenate them
+        text = tag.get_text()
+    return text.strip()
+
 
 class Cache(object):
     """Represents a geocache with its properties and methods for loading them.
@@ -32,76 +104,106 @@ class Cache(object):
 
     # generated by util.get_possible_attributes()
     # TODO: smarter way of keeping attributes up to date
-    _possible_attributes = {
-        "abandonedbuilding": "Abandoned Structure",
-        "uv": "UV Light Required",
-        "available": "Available at all times",
-        "bicycles": "Bicycles",
-        "boat": "Boat",
-        "campfires": "Campfires",
-        "camping": "Camping available",
-        "cliff": "Cliff / falling rocks",
-        "climbing": "Difficult climbing",
-        "cow": "Watch for livestock",
-        "danger": "Dangerous area",
-        "dangerousanimals": "Dangerous animals",
-        "dogs": "Dogs",
-        "fee": "Access or parking fee",
-        "field_puzzle": "Field Puzzle",
-        "firstaid": "Needs maintenance",
-        "flashlight": "Flashlight required",
-        "food": "Food Nearby",
-        "frontyard": "Front Yard (Private Residence)",
-        "fuel": "Fuel Nearby",
-        "geotour": "Geotour",
-        "hike_long": "Long Hike (+10km)",
-        "hike_med": "Medium hike (1km-10km)",
-        "hike_short": "Short hike (less than 1km)",
-        "hiking": "Significant hike",
-        "horses": "Horses",
-        "hunting": "Hunting",
-        "jeeps": "Off-road vehicles",
-        "kids": "Recommended for kids",
-        "landf": "Lost And Found Tour",
-        "mine": "Abandoned mines",
-        "motorcycles": "Motorcycles",
-        "night": "Recommended at night",
-        "nightcache": "Night Cache",
-        "onehour": "Takes less than one hour",
-        "parking": "Parking available",
-        "parkngrab": "Park and Grab",
-        "partnership": "Partnership Cache",
-        "phone": "Telephone nearby",
-        "picnic": "Picnic tables nearby",
-        "poisonoak": "Poison plants",
-        "public": "Public transportation",
-        "quads": "Quads",
-        "rappelling": "Climbing gear",
-        "restrooms": "Public restrooms nearby",
-        "rv": "Truck Driver/RV",
-        "s-tool": "Special Tool Required",
-        "scenic": "Scenic view",
-        "scuba": "Scuba gear",
-        "seasonal": "Seasonal Access",
-        "skiis": "Cross Country Skis",
-        "snowmobiles": "Snowmobiles",
-        "snowshoes": "Snowshoes",
-        "stealth": "Stealth required",
-        "strike": "Not allowed",
-        "stroller": "Stroller accessible",
-        "swimming": "May require swimming",
-        "teamwork": "Teamwork Required",
-        "thorn": "Thorns",
-        "ticks": "Ticks",
-        "touristok": "Tourist Friendly",
-        "treeclimbing": "Tree Climbing",
-        "wading": "May require wading",
-        "water": "Drinking water nearby",
-        "wheelchair": "Wheelchair accessible",
-        "winter": "Available during winter",
-        "wirelessbeacon": "Wireless Beacon"
+    # pairs of (name, human readable label), kept as a tuple which is a compile-time constant
+    _attribute_labels = (
+        ("abandonedbuilding", "Abandoned Structure"),
+        ("uv", "UV Light Required"),
+        ("available", "Available at all times"),
+        ("bicycles", "Bicycles"),
+        ("boat", "Boat"),
+        ("campfires", "Campfires"),
+        ("camping", "Camping available"),
+        ("cliff", "Cliff / falling rocks"),
+        ("climbing", "Difficult climbing"),
+        ("cow", "Watch for livestock"),
+        ("danger", "Dangerous area"),
+        ("dangerousanimals", "Dangerous animals"),
+        ("dogs", "Dogs"),
+        ("fee", "Access or parking fee"),
+        ("field_puzzle", "Field Puzzle"),
+        ("firstaid", "Needs maintenance"),
+        ("flashlight", "Flashlight required"),
+        ("food", "Food Nearby"),
+        ("frontyard", "Front Yard (Private Residence)"),
+        ("fuel", "Fuel Nearby"),
+        ("geotour", "Geotour"),
+        ("hike_long", "Long Hike (+10km)"),
+        ("hike_med", "Medium hike (1km-10km)"),
+        ("hike_short", "Short hike (less than 1km)"),
+        ("hiking", "Significant hike"),
+        ("horses", "Horses"),
+        ("hunting", "Hunting"),
+        ("jeeps", "Off-road vehicles"),
+        ("kids", "Recommended for kids"),
+        ("landf", "Lost And Found Tour"),
+        ("mine", "Abandoned mines"),
+        ("motorcycles", "Motorcycles"),
+        ("night", "Recommended at night"),
+        ("nightcache", "Night Cache"),
+        ("onehour", "Takes less than one hour"),
+        ("parking", "Parking available"),
+        ("parkngrab", "Park and Grab"),
+        ("partnership", "Partnership Cache"),
+        ("phone", "Telephone nearby"),
+        ("picnic", "Picnic tables nearby"),
+        ("poisonoak", "Poison plants"),
+        ("public", "Public transportation"),
+        ("quads", "Quads"),
+        ("rappelling", "Climbing gear"),
+        ("restrooms", "Public restrooms nearby"),
+        ("rv", "Truck Driver/RV"),
+        ("s-tool", "Special Tool Required"),
+        ("scenic", "Scenic view"),
+        ("scuba", "Scuba gear"),
+        ("seasonal", "Seasonal Access"),
+        ("skiis", "Cross Country Skis"),
+        ("snowmobiles", "Snowmobiles"),
+        ("snowshoes", "Snowshoes"),
+        ("stealth", "Stealth required"),
+        ("strike", "Not allowed"),
+        ("stroller", "Stroller accessible"),
+        ("swimming", "May require swimming"),
+        ("teamwork", "Teamwork Required"),
+        ("thorn", "Thorns"),
+        ("ticks", "Ticks"),
+        ("touristok", "Tourist Friendly"),
+        ("treeclimbing", "Tree Climbing"),
+        ("wading", "May require wading"),
+        ("water", "Drinking water nearby"),
+        ("wheelchair", "Wheelchair accessible"),
+        ("winter", "Available during winter"),
+        ("wirelessbeacon", "Wireless Beacon"),
+    )
+
+    # attribute names only, used for membership tests in the attributes setter
+    _possible_attribute_keys = frozenset(name for name, _ in _attribute_labels)
+
+    # dict of attribute labels, built on first call of possible_attributes()
+    _possible_attributes = None
+
+    # properties which trigger loading of cache details (see __getattr__) if they aren't filled in
+    _lazy_loaded_properties = frozenset({
+        "name", "location", "original_location", "waypoints", "type", "state",
+        "found", "size", "difficulty", "terrain", "author", "hidden",
+        "attributes", "summary", "description", "hint", "favorites", "log_counts",
+        "_logbook_token", "_trackable_page_url",
+    })
+
+    # keyword arguments accepted by __init__ which are stored as they are, mapped to attribute names
+    _plain_kwargs = {
+        "url": "url",
+        "waypoints": "_waypoints",
+        "log_counts": "_log_counts",
     }
 
+    # keyword arguments accepted by __init__ which need a property setter for validation or conversion
+    _setter_kwargs = frozenset({
+        "name", "type", "location", "original_location", "state", "found", "size",
+        "difficulty", "terrain", "author", "hidden", "attributes", "summary",
+        "description", "hint", "favorites", "pm_only", "_logbook_token",
+        "_trackable_page_url", "guid", "visited",
+    })
+
     # collection of urls used within the Cache class
     _urls = {
         "tiles_server": "http://tiles01.geocaching.com/map.details",
@@ -111,6 +213,9 @@ class Cache(object):
         "log_page": "play/geocache/{wp}/log",
     }
 
+    # number of seconds for which the data loaded from a log page are reused by post_log()
+    _log_page_ttl = 300
+
     @classmethod
     def _from_print_page(cls, geocaching, guid, soup):
         """Create a cache instance from a souped print-page and a GUID."""
@@ -122,7 +227,7 @@ class Cache(object):
         cache_info["wp"] = soup.find(class_="HalfRight").find("h1").text.strip()
         content = soup.find(id="Content")
         cache_info["name"] = content.find("h2").text.strip()
-        cache_info["type"] = Type.from_filename(content.h2.img["src"].split("/")[-1].partition(".")[0])
+        cache_info["type"] = Type.from_filename(_basename_noext(content.h2.img["src"]))
         cache_info["author"] = content.find(class_="Meta").text.partition(":")[2].strip()
         diff_terr = content.find(class_="DiffTerr").find_all("img")
         assert len(diff_terr) == 2
@@ -190,6 +295,16 @@ class Cache(object):
 
         return cache
 
+    @classmethod
+    def possible_attributes(cls):
+        """Return a dict of all known attributes, mapping attribute names to human readable labels.
+
+        :rtype: :class:`dict`
+        """
+        if cls._possible_attributes is None:
+            cls._possible_attributes = dict(cls._attribute_labels)
+        return cls._possible_attributes
+
     def __init__(self, geocaching, wp, **kwargs):
         """Create a cache instance.
 
@@ -203,14 +318,23 @@ class Cache(object):
         if wp is not None:
             self.wp = wp
 
-        known_kwargs = {"name", "type", "location", "original_location", "state", "found", "size",
-                        "difficulty", "terrain", "author", "hidden", "attributes", "summary",
-                        "description", "hint", "favorites", "pm_only", "url", "waypoints", "_logbook_token",
-                        "_trackable_page_url", "guid", "visited", "log_counts"}
+        # plain values can be stored directly, others go through property setters to be validated
+        for name in self._plain_kwargs.keys() & kwargs.keys():
+            self.__dict__[self._plain_kwargs[name]] = kwargs[name]
+        for name in self._setter_kwargs & kwargs.keys():
+            setattr(self, name, kwargs[name])
+
+    def __getattr__(self, name):
+        """Load cache details when a lazy loaded property isn't filled in yet.
 
-        for name in known_kwargs:
-            if name in kwargs:
-                setattr(self, name, kwargs[name])
+        Called by Python only if a normal attribute lookup fails, e.g. when a property getter raises
+        :class:`AttributeError` because of missing value. Loaded properties are then accessed directly.
+        """
+        if name not in self._lazy_loaded_properties:
+            raise AttributeError("'{}' object has no attribute '{}'".format(_type(self).__name__, name))
+        logging.debug("Lazy loading {} into <object {} id {}>".format(name, _type(self), id(self)))
+        self.load()
+        return object.__getattribute__(self, name)  # try to return it again
 
     def __str__(self):
         """Return cache GC code."""
@@ -258,6 +382,12 @@ class Cache(object):
         wp = str(wp).upper().strip()
         if not wp.startswith("GC"):
             raise errors.ValueError("GC code '{}' doesn't start with 'GC'.".format(wp))
+        if wp != getattr(self, "_wp", None):
+            # log page url and data (with the monotonic time of their loading, see post_log())
+            # belong to the previous GC code
+            self._log_page_url = None
+            self._log_page = None
+            self._log_page_timestamp = 0
         self._wp = wp
 
     @property
@@ -271,8 +401,7 @@ class Cache(object):
     @guid.setter
     def guid(self, guid):
         guid = guid.strip()
-        guid_regex = "^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$"
-        if not re.match(guid_regex, guid):
+        if not _is_guid(guid):
             raise errors.ValueError("GUID not well formatted: {}".format(guid))
         self._guid = guid
 
@@ -292,7 +421,6 @@ class Cache(object):
         self._geocaching = geocaching
 
     @property
-    @lazy_loaded
     def name(self):
         """A human readable name of cache.
 
@@ -306,7 +434,6 @@ class Cache(object):
         self._name = name
 
     @property
-    @lazy_loaded
     def location(self):
         """The cache location.
 
@@ -318,15 +445,15 @@ class Cache(object):
 
     @location.setter
     def location(self, location):
-        if isinstance(location, str):
-            location = Point.from_string(location)
-        elif not isinstance(location, Point):
+        if isinstance(location, Point):
+            self._location = location
+        elif isinstance(location, str):
+            self._location = Point.from_string(location)
+        else:
             raise errors.ValueError(
                 "Passed object is not Point instance nor string containing coordinates.")
-        self._location = location
 
     @property
-    @lazy_loaded
     def original_location(self):
         """The cache original location.
 
@@ -338,15 +465,15 @@ class Cache(object):
 
     @original_location.setter
     def original_location(self, original_location):
-        if isinstance(original_location, str):
-            original_location = Point.from_string(original_location)
-        elif not isinstance(original_location, Point) and original_location is not None:
+        if original_location is None or isinstance(original_location, Point):
+            self._original_location = original_location
+        elif isinstance(original_location, str):
+            self._original_location = Point.from_string(original_location)
+        else:
             raise errors.ValueError(
                 "Passed object is not Point instance nor string containing coordinates.")
-        self._original_location = original_location
 
     @property
-    @lazy_loaded
     def waypoints(self):
         """Any waypoints listed in the cache.
 
@@ -360,7 +487,6 @@ class Cache(object):
         self._waypoints = waypoints
 
     @property
-    @lazy_loaded
     def type(self):
         """The cache type.
 
@@ -377,7 +503,6 @@ class Cache(object):
         self._type = type
 
     @property
-    @lazy_loaded
     def state(self):
         """The cache status.
 
@@ -392,7 +517,6 @@ class Cache(object):
         self._state = bool(state)
 
     @property
-    @lazy_loaded
     def found(self):
         """The cache found status.
 
@@ -401,7 +525,7 @@ class Cache(object):
         :type: :class:`bool`
         """
         if self._found_status:
-            return self._found_status.type in (LogType.found_it, LogType.attended)
+            return self._found_status.type in _FOUND_LOG_TYPES
         else:
             return False
 
@@ -414,7 +538,6 @@ class Cache(object):
             self._found_status = None
 
     @property
-    @lazy_loaded
     def size(self):
         """The cache size.
 
@@ -431,7 +554,6 @@ class Cache(object):
         self._size = size
 
     @property
-    @lazy_loaded
     def difficulty(self):
         """The cache difficulty.
 
@@ -450,7 +572,6 @@ class Cache(object):
         self._difficulty = difficulty
 
     @property
-    @lazy_loaded
     def terrain(self):
         """The cache terrain.
 
@@ -469,7 +590,6 @@ class Cache(object):
         self._terrain = terrain
 
     @property
-    @lazy_loaded
     def author(self):
         """The cache author.
 
@@ -483,7 +603,6 @@ class Cache(object):
         self._author = author
 
     @property
-    @lazy_loaded
     def hidden(self):
         """The cache hidden date.
 
@@ -495,12 +614,13 @@ class Cache(object):
 
     @hidden.setter
     def hidden(self, hidden):
-        if isinstance(hidden, str):
-            hidden = parse_date(hidden)
-        elif not isinstance(hidden, datetime.date):
+        if isinstance(hidden, datetime.date):
+            self._hidden = hidden
+        elif isinstance(hidden, str):
+            self._hidden = parse_date(hidden)
+        else:
             raise errors.ValueError(
                 "Passed object is not datetime.date instance nor string containing a date.")
-        self._hidden = hidden
 
     @property
     def visited(self):
@@ -514,22 +634,22 @@ class Cache(object):
 
     @visited.setter
     def visited(self, visited):
-        if isinstance(visited, str):
-            visited = parse_date(visited)
-        elif not isinstance(visited, datetime.date):
+        if isinstance(visited, datetime.date):
+            self._visited = visited
+        elif isinstance(visited, str):
+            self._visited = parse_date(visited)
+        else:
             raise errors.ValueError(
                 "Passed object is not datetime.date instance nor string containing a date.")
-        self._visited = visited
 
     @property
-    @lazy_loaded
     def attributes(self):
         """The cache attributes.
 
         :setter: Set a cache attributes. Walk through passed :class:`dict` and use :class:`str`
             keys as attribute names and :class:`bool` values as positive / negative attributes.
             Unknown attributes are ignored with warning (you can find possible attribute keys
-            in :attr:`.Cache._possible_attributes`).
+            using :meth:`.Cache.possible_attributes`).
         :type: :class:`dict`
         """
         return self._attributes
@@ -542,13 +662,12 @@ class Cache(object):
         self._attributes = {}
         for name, allowed in attributes.items():
             name = name.strip().lower()
-            if name in self._possible_attributes:
+            if name in self._possible_attribute_keys:
                 self._attributes[name] = allowed
             else:
                 logging.warning("Unknown attribute {}, ignoring.".format(name))
 
     @property
-    @lazy_loaded
     def summary(self):
         """The cache text summary.
 
@@ -562,7 +681,6 @@ class Cache(object):
         self._summary = summary
 
     @property
-    @lazy_loaded
     def description(self):
         """The cache long description.
 
@@ -576,7 +694,6 @@ class Cache(object):
         self._description = description
 
     @property
-    @lazy_loaded
     def hint(self):
         """The cache hint.
 
@@ -591,7 +708,6 @@ class Cache(object):
         self._hint = hint
 
     @property
-    @lazy_loaded
     def favorites(self):
         """The cache favorite points.
 
@@ -604,7 +720,6 @@ class Cache(object):
         self._favorites = int(favorites)
 
     @property
-    @lazy_loaded
     def log_counts(self):
         """The log count for each log type.
 
@@ -631,7 +746,6 @@ class Cache(object):
         self._pm_only = bool(pm_only)
 
     @property
-    @lazy_loaded
     def _logbook_token(self):
         """The token used to load logbook pages for cache.
 
@@ -644,7 +758,6 @@ class Cache(object):
         self.__logbook_token = logbook_token
 
     @property
-    @lazy_loaded
     def _trackable_page_url(self):
         """The URL of page containing all trackables stored in this cache.
 
@@ -722,12 +835,12 @@ class Cache(object):
 
             self.author = cache_details("a")[1].text
 
-            D_and_T_img = root.find("div", "CacheStarLabels").find_all("img")
+            D_and_T_img = root.find("div", "CacheStarLabels").find_all("img", limit=2)
             self.difficulty, self.terrain = [float(img.get("alt").split()[0]) for img in D_and_T_img]
 
             size = root.find("div", "CacheSize")
             size = size.find("img").get("src")  # size img src
-            size = size.split("/")[-1].rsplit(".", 1)[0]  # filename w/o extension
+            size = _basename_noext(size)
             self.size = Size.from_filename(size)
 
         # use shared functionality as both cases use the same method
@@ -740,9 +853,9 @@ class Cache(object):
 
         # details not avaliable for basic members for PM only caches ------------------------------
         pm_only_warning = root.find("p", "Warning NoBottomSpacing")
-        self.pm_only = pm_only_warning and ("Premium Member Only" in pm_only_warning.text) or False
+        self.pm_only = pm_only_warning is not None and "Premium Member Only" in pm_only_warning.text
 
-        attributes_widget, inventory_widget, *_ = root.find_all("div", "CacheDetailNavigationWidget")
+        attributes_widget, inventory_widget = root.find_all("div", "CacheDetailNavigationWidget", limit=2)
 
         hidden = cache_details.find("div", "minorCacheDetails").find_all("div")[1].text
         self.hidden = parse_date(hidden.split(":")[-1])
@@ -753,16 +866,13 @@ class Cache(object):
 
         log_image = root.find(id="ctl00_ContentBody_GeoNav_logTypeImage")
         if log_image:
-            log_image_filename = log_image.get("src").split("/")[-1].rsplit(".", 1)[0]  # filename w/o extension
+            log_image_filename = _basename_noext(log_image.get("src"))
             self._found_status = Log(type=LogType.from_filename(log_image_filename))
         else:
             self._found_status = None
 
-        attributes_raw = attributes_widget.find_all("img")
-        attributes_raw = [_.get("src").split("/")[-1].rsplit("-", 1) for _ in attributes_raw]
-
-        self.attributes = {attribute_name: appendix.startswith("yes") for attribute_name, appendix
-                           in attributes_raw if not appendix.startswith("blank")}
+        attributes_raw = [_ATTR_NAME_RE.search(img.get("src", "")) for img in attributes_widget.find_all("img")]
+        self.attributes = {match.group(1): match.group(2) == "yes" for match in attributes_raw if match}
 
         self.summary = root.find(id="ctl00_ContentBody_ShortDescription").text
         self.description = root.find(id="ctl00_ContentBody_LongDescription").text
@@ -775,17 +885,27 @@ class Cache(object):
         else:
             self.favorites = 0
 
-        js_content = "\n".join(root.find_all(string=lambda i: isinstance(i, Script)))
-        self._logbook_token = re.findall("userToken\\s*=\\s*'([^']+)'", js_content)[0]
-        # find original location if any
-        if "oldLatLng\":" in js_content:
-            old_lat_long = js_content.split("oldLatLng\":")[1].split(']')[0].split('[')[1]
-            self.original_location = Point(old_lat_long)
-        else:
-            self.original_location = None
+        # search scripts one by one for logbook token and original location (if any)
+        logbook_token = old_lat_long = None
+        for script in root.find_all("script"):
+            js_content = script.string
+            if not js_content:
+                continue
+            if logbook_token is None:
+                match = _USER_TOKEN_RE.search(js_content)
+                logbook_token = match and match.group(1)
+            if old_lat_long is None:
+                match = _OLD_LATLNG_RE.search(js_content)
+                old_lat_long = match and match.group(1)
+            if logbook_token and old_lat_long:
+                break
+        if logbook_token is None:
+            raise errors.LoadError("Logbook token not found in cache details page")
+        self._logbook_token = logbook_token
+        self.original_location = Point(old_lat_long) if old_lat_long else None
 
         # if there are some trackables
-        if len(inventory_widget.find_all("a")) >= 3:
+        if len(inventory_widget.find_all("a", limit=3)) >= 3:
             trackable_page_url = inventory_widget.find(id="ctl00_ContentBody_uxTravelBugList_uxViewAllTrackableItems")
             self._trackable_page_url = trackable_page_url.get("href")[3:]  # has "../" on start
         else:
@@ -813,7 +933,7 @@ class Cache(object):
                                        expect="json")
 
         if res["status"] == "failed" or len(res["data"]) != 1:
-            msg = res["msg"] if "msg" in res else "Unknown error (probably not existing cache)"
+            msg = res.get("msg", "Unknown error (probably not existing cache)")
             raise errors.LoadError("Cache {} cannot be loaded: {}".format(self, msg))
 
         data = res["data"][0]
@@ -861,13 +981,12 @@ class Cache(object):
         self.location = Point.from_string(
             content.find("p", "LatLong Meta").text)
 
-        type_img = os.path.basename(content.find("img").get("src"))
-        self.type = Type.from_filename(os.path.splitext(type_img)[0])
+        self.type = Type.from_filename(_basename_noext(content.find("img").get("src")))
 
-        size_img = content.find("img", src=re.compile(r"\/icons\/container\/"))
+        size_img = content.find("img", src=_CONTAINER_SRC_RE)
         self.size = Size.from_string(size_img.get("alt").split(": ")[1])
 
-        D_and_T_img = content.find("p", "Meta DiffTerr").find_all("img")
+        D_and_T_img = content.find("p", "Meta DiffTerr").find_all("img", limit=2)
         self.difficulty, self.terrain = [
             float(img.get("alt").split()[0]) for img in D_and_T_img
         ]
@@ -875,18 +994,15 @@ class Cache(object):
         # TODO do NOT use English phrases like "Placed by" to search for attributes
 
         self.author = content.find(
-            "p", text=re.compile("Placed by:")).text.split("\r\n")[2].strip()
+            "p", text=_PLACED_BY_RE).text.partition("Placed by:")[2].strip()
 
-        hidden_p = content.find("p", text=re.compile("Placed Date:"))
+        hidden_p = content.find("p", text=_PLACED_DATE_RE)
         self.hidden = hidden_p.text.replace("Placed Date:", "").strip()
 
-        attr_img = content.find_all("img", src=re.compile(r"\/attributes\/"))
-        attributes_raw = [
-            os.path.basename(_.get("src")).rsplit("-", 1) for _ in attr_img
-        ]
+        attr_img = content.find_all("img", src=_ATTR_SRC_RE)
+        attributes_raw = [_ATTR_NAME_RE.search(_.get("src")) for _ in attr_img]
         self.attributes = {
-            name: appendix.startswith("yes") for name, appendix
-            in attributes_raw if not appendix.startswith("blank")
+            match.group(1): match.group(2) == "yes" for match in attributes_raw if match
         }
 
         self.summary = content.find(
@@ -898,7 +1014,7 @@ class Cache(object):
         self.hint = content.find(id="uxEncryptedHint").text
 
         self.favorites = content.find(
-            "strong", text=re.compile("Favorites:")).parent.text.split()[-1]
+            "strong", text=_FAVORITES_RE).parent.text.split()[-1]
 
         self.waypoints = Waypoint.from_html(content, "Waypoints")
 
@@ -925,7 +1041,7 @@ class Cache(object):
         types = []
         for image in images:
             type = image["src"]  # "../images/logtypes/2.png"
-            type = type.split("/")[-1].split(".")[0]  # "2"
+            type = _basename_noext(type)  # "2"
             type = LogType.from_filename(type)
             types.append(type)
 
@@ -976,7 +1092,7 @@ class Cache(object):
         types = []
         for image in images:
             type = image["src"]  # "../images/logtypes/2.png"
-            type = type.split("/")[-1].split(".")[0]  # "2"
+            type = _basename_noext(type)  # "2"
             type = LogType.from_filename(type)
             types.append(type)
 
@@ -1006,7 +1122,7 @@ class Cache(object):
         }, expect="json")
 
         if res["status"] != "success":
-            error_msg = res["msg"] if "msg" in res else "Unknown error"
+            error_msg = res.get("msg", "Unknown error")
             raise errors.LoadError("Logbook cannot be loaded: {}".format(error_msg))
 
         return res["data"]
@@ -1014,40 +1130,54 @@ class Cache(object):
     def load_logbook(self, limit=float("inf")):
         """Return a generator of logs for this cache.
 
-        Yield instances of :class:`.Log` filled with log data.
+        Yield instances of :class:`.Log` filled with log data. The next logbook page is loaded in
+        background while logs from the current one are being consumed.
 
         :param int limit: Maximum number of logs to generate.
         """
         logging.info("Loading logbook for {}...".format(self))
 
+        if limit <= 0:
+            return
+
         page = 0
         per_page = min(limit, 100)  # max number to fetch in one request is 100 items
 
-        while True:
-            # get one page
-            logbook_page = self._logbook_get_page(page, per_page)
-            page += 1
-
-            if not logbook_page:
-                # result is empty - no more logs
-                return
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            next_page = executor.submit(self._logbook_get_page, page, per_page)
 
-            for log_data in logbook_page:
+            while True:
+                # get one page
+                logbook_page = next_page.result()
+                page += 1
 
-                limit -= 1  # handle limit
-                if limit < 0:
+                if not logbook_page:
+                    # result is empty - no more logs
                     return
 
-                img_filename = log_data["LogTypeImage"].rsplit(".", 1)[0]  # filename w/o extension
+                # handle limit
+                if limit < len(logbook_page):
+                    logbook_page = logbook_page[:int(limit)]
+                    limit = 0  # the limit is reached within this page, so it is the last one
+                else:
+                    limit -= len(logbook_page)
+
+                if limit <= 0:
+                    next_page = None
+                else:
+                    # prefetch next page while the current one is being consumed
+                    next_page = executor.submit(self._logbook_get_page, page, per_page)
 
-                # create and fill log object
-                yield Log(
-                    uuid=log_data['LogGuid'],
-                    type=LogType.from_filename(img_filename),
-                    text=log_data["LogText"],
-                    visited=log_data["Visited"],
-                    author=log_data["UserName"]
-                )
+                for log_data in logbook_page:
+                    # create and fill log object
+                    yield Log._from_logbook_json(log_data)
+
+                if next_page is None:
+                    return
+        finally:
+            # don't block the caller if it stops consuming logs while a page is being prefetched
+            executor.shutdown(wait=False)
 
     # TODO: trackable list can have multiple pages - handle it in similar way as _logbook_get_page
     # for example see: http://www.geocaching.com/geocache/GC26737_geocaching-jinak-tb-gc-hrbitov
@@ -1061,6 +1191,9 @@ class Cache(object):
         logging.info("Loading trackables for {}...".format(self))
         self.trackables = []
 
+        if limit <= 0:
+            return
+
         url = self._trackable_page_url  # will trigger lazy_loading if needed
         if not url:
             # no link to all trackables = no trackables in cache
@@ -1068,18 +1201,18 @@ class Cache(object):
         res = self.geocaching._request(url)
 
         trackable_table = res.find_all("table")[1]
-        links = trackable_table.find_all("a")
-        # filter out all urls for trackables
-        urls = [link.get("href") for link in links if "track" in link.get("href")]
-        # find the names matching the trackble urls
-        names = [re.split(r"[\<\>]", str(link))[2] for link in links if "track" in link.get("href")]
-
-        for name, url in zip(names, urls):
-
-            limit -= 1  # handle limit
-            if limit < 0:
-                return
-
+        # filter out all links to trackables and take their names and urls
+        trackable_links = []
+        for link in trackable_table.find_all("a"):
+            href = link.get("href")
+            if href and "track" in href:
+                trackable_links.append((link.get_text(strip=True), href))
+
+        # handle limit
+        if limit < len(trackable_links):
+            trackable_links = trackable_links[:int(limit)]
+
+        for name, url in trackable_links:
             # create and fill trackable object
             t = Trackable(self.geocaching, None)
             t.name = name
@@ -1088,7 +1221,9 @@ class Cache(object):
             yield t
 
     def _get_log_page_url(self):
-        return self._urls["log_page"].format(wp=self.wp.lower())
+        if self._log_page_url is None:
+            self._log_page_url = self._urls["log_page"].format(wp=self.wp.lower())
+        return self._log_page_url
 
     def _load_log_page(self):
         """Load a logging page for this cache.
@@ -1096,14 +1231,15 @@ class Cache(object):
         :return: Tuple of data nescessary to log the cache.
         :rtype: :class:`tuple` of (:class:`set`:, :class:`dict`, class:`str`)
         """
-        log_page = self.geocaching._request(self._get_log_page_url())
+        res = self.geocaching._request(self._get_log_page_url(), expect="raw")
+        # only a few form fields are needed, so skip BeautifulSoup and query lxml tree directly
+        log_page = etree.fromstring(res.content, etree.HTMLParser(encoding=res.encoding))
 
         # find all valid log types for the cache
-        valid_types = {o["value"] for o in log_page.find("select", attrs={"name": "LogTypeId"}).find_all("option")}
+        valid_types = {str(value) for value in _LOG_TYPES_XPATH(log_page)}  # don't keep the tree alive
 
         # find all static data fields needed for log
-        hidden_inputs = log_page.find_all("input", type=["hidden", "submit"])
-        hidden_inputs = {i["name"]: i.get("value", "") for i in hidden_inputs}
+        hidden_inputs = {i.get("name"): i.get("value", "") for i in _LOG_INPUTS_XPATH(log_page)}
 
         return valid_types, hidden_inputs
 
@@ -1115,19 +1251,27 @@ class Cache(object):
         if not log.text:
             raise errors.ValueError("Log text is empty")
 
-        valid_types, hidden_inputs = self._load_log_page()
+        # reuse recently loaded log page, so posting more logs doesn't download it every time
+        now = time.monotonic()
+        if self._log_page is None or now - self._log_page_timestamp >= self._log_page_ttl:
+            self._log_page = self._load_log_page()
+            self._log_page_timestamp = now
+        valid_types, hidden_inputs = self._log_page
+
         if log.type.value not in valid_types:
             raise errors.ValueError("The cache does not accept this type of log")
 
         # assemble post data
-        post = hidden_inputs
+        post = dict(hidden_inputs)
         post["LogTypeId"] = log.type.value
-        post["LogDate"] = log.visited.strftime("%Y-%m-%d")
+        post["LogDate"] = log.visited.isoformat()[:10]  # YYYY-MM-DD, also for datetime instances
         post["LogText"] = log.text
 
         self.geocaching._request(self._get_log_page_url(), method="POST", data=post)
 
-        self.found_status = log
+        # only finding logs change the found status, e.g. a note on a found cache keeps it found
+        if log.type in _FOUND_LOG_TYPES:
+            self._found_status = log
 
 
 class Waypoint(object):
@@ -1139,6 +1283,9 @@ class Waypoint(object):
        :param Point location: waypoint coordinates
        :param str note: Information about the waypoint
     """
+
+    __slots__ = ("_identifier", "_type", "_location", "_note")
+
     def __init__(self, id=None, type=None, location=None, note=None):
         self._identifier = id
         self._type = type
@@ -1155,24 +1302,93 @@ class Waypoint(object):
         :param str table_id: html id of the waypoints table
         """
         waypoints_dict = {}
-        waypoints_table = soup.find('table', id=table_id)
-        if waypoints_table:
-            waypoints_table = waypoints_table.find_all("tr")
-            for r1, r2 in zip(waypoints_table[1::2], waypoints_table[2::2]):
-                columns = r1.find_all("td") + r2.find_all("td")
-                identifier = columns[3].text.strip()
-                type = columns[1].find("img").get("title")
-                location_string = columns[5].text.strip()
-                try:
-                    loc = Point(location_string)
-                except ValueError:
-                    loc = None
-                    logging.debug("No valid location format in waypoint {}: {}".format(
-                        identifier, location_string))
-                note = columns[8].text.strip()
-                waypoints_dict[identifier] = cls(identifier, type, loc, note)
+        for identifier, type, loc, note in cls._parse_table(soup.find("table", id=table_id)):
+            waypoints_dict[identifier] = cls(identifier, type, loc, note)
         return waypoints_dict
 
+    @classmethod
+    def from_html_table(cls, soup, table_id):
+        """Return a :class:`.WaypointTable` of all waypoints found in the page representation
+
+        Unlike :meth:`from_html`, no :class:`.Waypoint` objects are created.
+
+        :param bs4.BeautifulSoup soup: parsed html document containing the
+            waypoints table
+        :param str table_id: html id of the waypoints table
+        """
+        table = WaypointTable()
+        for identifier, type, loc, note in cls._parse_table(soup.find("table", id=table_id)):
+            table.append(identifier, type, loc, note)
+        return table
+
+    @staticmethod
+    def _parse_table(waypoints_table):
+        """Generate :code:`(identifier, type, location, note)` tuples from rows of a waypoints table.
+
+        :param bs4.element.Tag waypoints_table: the waypoints table or :code:`None` if there is
+            no such table in the page
+        """
+        if not waypoints_table:
+            return
+        rows = _table_rows(waypoints_table)
+        next(rows, None)  # skip header
+        # each waypoint spans two consecutive rows
+        for r1, r2 in zip(rows, rows):
+            columns = _child_tags(r1, "td") + _child_tags(r2, "td")
+            identifier = _cell_text(columns[3])
+            type_image = columns[1].find("img", recursive=False) or columns[1].find("img")
+            if type_image is None:
+                raise errors.LoadError("Type image not found in waypoint {}".format(identifier))
+            type = type_image.get("title")
+            if type is not None:
+                # there are just a few waypoint types, so keep only one copy of each of them
+                type = sys.intern(type)
+            loc = Waypoint._parse_location(identifier, _cell_text(columns[5]))
+            note = _cell_text(columns[8])
+            yield identifier, type, loc, note
+
+    @classmethod
+    def from_lxml(cls, root, table_id):
+        """Return a dictionary of all waypoints found in the page representation
+
+        Same as :meth:`from_html`, but reads an already parsed :mod:`lxml` tree without
+        wrapping it in BeautifulSoup.
+
+        :param lxml.etree._Element root: parsed html document containing the
+            waypoints table, e.g. from :func:`lxml.html.fromstring`
+        :param str table_id: html id of the waypoints table
+        """
+        waypoints_dict = {}
+        rows = iter(_WAYPOINT_ROWS_XPATH(root, id=table_id))
+        next(rows, None)  # skip header
+        # each waypoint spans two consecutive rows
+        for r1, r2 in zip(rows, rows):
+            columns = r1.findall("td") + r2.findall("td")
+            identifier = "".join(columns[3].itertext()).strip()
+            type_image = columns[1].find("img")
+            if type_image is None:
+                type_image = columns[1].find(".//img")
+            if type_image is None:
+                raise errors.LoadError("Type image not found in waypoint {}".format(identifier))
+            type = type_image.get("title")
+            if type is not None:
+                type = sys.intern(type)
+            loc = cls._parse_location(identifier, "".join(columns[5].itertext()).strip())
+            note = "".join(columns[8].itertext()).strip()
+            waypoints_dict[identifier] = cls(identifier, type, loc, note)
+        return waypoints_dict
+
+    @staticmethod
+    def _parse_location(identifier, location_string):
+        """Return a :class:`.Point` parsed from waypoint coordinates or :code:`None` if there are none."""
+        if _WAYPOINT_COORDS_RE.match(location_string):
+            try:
+                return Point(location_string)
+            except ValueError:
+                pass
+        logging.debug("No valid location format in waypoint {}: {}".format(identifier, location_string))
+        return None
+
     def __str__(self):
         return self.identifier
 
@@ -1210,12 +1426,13 @@ class Waypoint(object):
 
     @location.setter
     def location(self, location):
-        if isinstance(location, str):
-            location = Point.from_string(location)
-        elif not isinstance(location, Point):
+        if isinstance(location, Point):
+            self._location = location
+        elif isinstance(location, str):
+            self._location = Point.from_string(location)
+        else:
             raise errors.ValueError(
                 "Passed object is not Point instance nor string containing coordinates.")
-        self._location = location
 
     @property
     def note(self):
@@ -1230,6 +1447,56 @@ class Waypoint(object):
         self._note = note
 
 
+class WaypointTable(object):
+    """Stores many waypoints column by column instead of one object per waypoint.
+
+    Coordinates are kept in packed arrays, so scanning them (e.g. for distance filtering) is cheap.
+    Missing locations are stored as NaN. Indexing or iterating the table creates
+    :class:`.Waypoint` objects on demand.
+    """
+
+    __slots__ = ("ids", "types", "lats", "lons", "notes")
+
+    def __init__(self):
+        self.ids = []
+        self.types = []
+        self.lats = array("d")
+        self.lons = array("d")
+        self.notes = []
+
+    def append(self, identifier, type, location, note):
+        """Add a waypoint to the end of the table.
+
+        :param str identifier: the unique identifier of the location
+        :param str type: type of waypoint
+        :param Point location: waypoint coordinates or :code:`None`
+        :param str note: Information about the waypoint
+        """
+        self.ids.append(identifier)
+        self.types.append(type)
+        if location is None:
+            self.lats.append(float("nan"))
+            self.lons.append(float("nan"))
+        else:
+            self.lats.append(location.latitude)
+            self.lons.append(location.longitude)
+        self.notes.append(note)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __getitem__(self, index):
+        if not isinstance(index, int):  # slices would yield whole columns
+            raise TypeError("WaypointTable indices must be integers, not {}".format(_type(index).__name__))
+        lat, lon = self.lats[index], self.lons[index]
+        location = None if lat != lat else Point(lat, lon)  # NaN is the only value not equal to itself
+        return Waypoint(self.ids[index], self.types[index], location, self.notes[index])
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+
 class Type(enum.Enum):
     """Enum of possible cache types.
 
@@ -1263,64 +1530,88 @@ class Type(enum.Enum):
         """Return a cache type from its image filename.
 
            Values are cache image filenames - http://www.geocaching.com/images/WptTypes/[VALUE].gif
+
+        :raise .ValueError: If cache type cannot be determined.
         """
-        # fuck Groundspeak, they sometimes use 2 exactly same icons with 2 different names
-        name_mapping = {
-            "ape_32": "9",
-            "earthcache": "137",
-            "mega": "453",
-            "10Years_32": "3653",
-            "HQ_32": "3773",
-            "giga": "7005"
-        }
-        if filename in name_mapping:
-            filename = name_mapping[filename]
-        return cls(filename)
+        try:
+            return _TYPE_FILENAMES[filename]
+        except KeyError as e:
+            raise errors.ValueError("Unknown cache type image '{}'.".format(filename)) from e
 
     @classmethod
+    @functools.lru_cache(maxsize=64)  # pages repeat only a handful of names
     def from_string(cls, name):
         """Return a cache type from its human readable name.
 
         :raise .ValueError: If cache type cannot be determined.
         """
-        name = name.replace(" Geocache", "")  # with space!
-        name = name.replace(" Cache", "")  # with space!
-        name = name.lower().strip()
-
-        name_mapping = {
-            "traditional": cls.traditional,
-            "multi-cache": cls.multicache,
-            "mystery": cls.mystery,
-            "unknown": cls.unknown,
-            "letterbox hybrid": cls.letterbox,
-            "event": cls.event,
-            "mega-event": cls.mega_event,
-            "giga-event": cls.giga_event,
-            "earthcache": cls.earthcache,
-            "cito": cls.cito,
-            "cache in trash out event": cls.cache_in_trash_out_event,
-            "webcam": cls.webcam,
-            "virtual": cls.virtual,
-            "wherigo": cls.wherigo,
-            "lost and found event": cls.community_celebration,
-            "project ape": cls.project_ape,
-            "geocaching hq": cls.geocaching_hq,
-            "groundspeak hq": cls.geocaching_hq,
-            "gps adventures exhibit": cls.gps_adventures_exhibit,
-            "groundspeak block party": cls.groundspeak_block_party,
-            "locationless (reverse)": cls.locationless,
-            "geocaching hq celebration": cls.hq_celebration,
-            "community celebration event": cls.community_celebration
-        }
+        name = name.strip().lower()
+        # drop the type suffix, which is present in most of names
+        if name.endswith(" cache"):  # with space!
+            name = name[:-6].rstrip()
+        elif name.endswith(" geocache"):  # with space!
+            name = name[:-9].rstrip()
 
         try:
-            return name_mapping[name]
+            return _TYPE_NAMES[name]
         except KeyError as e:
             raise errors.ValueError("Unknown cache type '{}'.".format(name)) from e
 
     @classmethod
     def from_number(cls, number: int):
-        return Type(str(number))
+        """Return a cache type from its numeric id.
+
+        :raise .ValueError: If cache type cannot be determined.
+        """
+        number = int(number)
+
+        try:
+            return _TYPE_NUMBERS[number]
+        except KeyError as e:
+            raise errors.ValueError("Unknown cache type numeric id '{}'.".format(number)) from e
+
+
+# numeric ids of cache types used by API, see Type.from_number()
+_TYPE_NUMBERS = {int(member.value): member for member in Type}
+
+# image filenames of cache types, see Type.from_filename()
+_TYPE_FILENAMES = {member.value: member for member in Type}
+# fuck Groundspeak, they sometimes use 2 exactly same icons with 2 different names
+_TYPE_FILENAMES.update({
+    "ape_32": Type.project_ape,
+    "earthcache": Type.earthcache,
+    "mega": Type.mega_event,
+    "10Years_32": Type.community_celebration,
+    "HQ_32": Type.geocaching_hq,
+    "giga": Type.giga_event,
+})
+
+# human readable names of cache types (lowercase, without "Cache" suffix), see Type.from_string()
+_TYPE_NAMES = {
+    "traditional": Type.traditional,
+    "multi-cache": Type.multicache,
+    "mystery": Type.mystery,
+    "unknown": Type.unknown,
+    "letterbox hybrid": Type.letterbox,
+    "event": Type.event,
+    "mega-event": Type.mega_event,
+    "giga-event": Type.giga_event,
+    "earthcache": Type.earthcache,
+    "cito": Type.cito,
+    "cache in trash out event": Type.cache_in_trash_out_event,
+    "webcam": Type.webcam,
+    "virtual": Type.virtual,
+    "wherigo": Type.wherigo,
+    "lost and found event": Type.community_celebration,
+    "project ape": Type.project_ape,
+    "geocaching hq": Type.geocaching_hq,
+    "groundspeak hq": Type.geocaching_hq,
+    "gps adventures exhibit": Type.gps_adventures_exhibit,
+    "groundspeak block party": Type.groundspeak_block_party,
+    "locationless (reverse)": Type.locationless,
+    "geocaching hq celebration": Type.hq_celebration,
+    "community celebration event": Type.community_celebration
+}
 
 
 class Size(enum.Enum):
@@ -1338,11 +1629,13 @@ class Size(enum.Enum):
     other = "other"
 
     @classmethod
+    @functools.lru_cache(maxsize=None)  # the set of filenames is small and fixed
     def from_filename(cls, filename):
         """Return a cache size from its image filename."""
         return cls[filename]
 
     @classmethod
+    @functools.lru_cache(maxsize=64)  # pages repeat only a handful of names
     def from_string(cls, name):
         """Return a cache size from its human readable name.
 
@@ -1351,8 +1644,8 @@ class Size(enum.Enum):
         name = name.strip().lower()
 
         try:
-            return cls(name)
-        except ValueError as e:
+            return _SIZE_NAMES[name]
+        except KeyError as e:
             raise errors.ValueError("Unknown cache size '{}'.".format(name)) from e
 
     @classmethod
@@ -1363,22 +1656,27 @@ class Size(enum.Enum):
         """
         number = int(number)
 
-        number_mapping = {
-            1: cls.not_chosen,
-            2: cls.micro,
-            3: cls.regular,
-            4: cls.large,
-            5: cls.virtual,
-            6: cls.other,
-            8: cls.small,
-        }
-
         try:
-            return number_mapping[number]
+            return _SIZE_NUMBERS[number]
         except KeyError as e:
             raise errors.ValueError("Unknown cache size numeric id '{}'.".format(number)) from e
 
 
+# human readable names of cache sizes, see Size.from_string()
+_SIZE_NAMES = {size.value: size for size in Size}
+
+# numeric ids of cache sizes used by API, see Size.from_number()
+_SIZE_NUMBERS = {
+    1: Size.not_chosen,
+    2: Size.micro,
+    3: Size.regular,
+    4: Size.large,
+    5: Size.virtual,
+    6: Size.other,
+    8: Size.small,
+}
+
+
 class Status(enum.IntEnum):
     """Enum of possible cache statuses."""
     # NOTE: extracted from https://www.geocaching.com/play/map/public/main.2b28b0dc1c9c10aaba66.js
@@ -8,6 +8,7 @@ import json
 import subprocess
 import warnings
 import enum
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Union
 from urllib.parse import parse_qs, urljoin, urlparse
 from os import path
@@ -78,7 +79,8 @@ class Geocaching(object):
 
             # return bs4.BeautifulSoup, JSON dict or raw requests.Response
             if expect == "soup":
-                return bs4.BeautifulSoup(res.text, "html.parser")
+                # pass raw bytes with known encoding to skip decoding and charset detection
+                return bs4.BeautifulSoup(res.content, "lxml", from_encoding=res.encoding)
             elif expect == "json":
                 return res.json()
             elif expect == "raw":
@@ -481,6 +483,31 @@ class Geocaching(object):
         log = Log(type=type, text=text, visited=date)
         self.get_cache(wp).post_log(log)
 
+    def post_logs(self, logs, *, max_workers=4):
+        """Post many logs at once.
+
+        Logs for the same cache are posted one after another, so its log page is loaded only once.
+        Logs for different caches are posted in parallel, all of them using the same session.
+
+        :param logs: Iterable of :code:`(wp, log)` pairs, where :code:`wp` is a cache waypoint and
+            :code:`log` a :class:`.Log` filled with data.
+        :param int max_workers: Maximum number of caches being logged at the same time. All worker
+            threads share one :class:`requests.Session`, so a large number of workers will soon hit
+            the rate limiting of geocaching.com (see :class:`.TooManyRequestsError`).
+        """
+        logs_by_wp = {}
+        for wp, log in logs:
+            logs_by_wp.setdefault(wp, []).append(log)
+
+        def post_cache_logs(wp, cache_logs):
+            cache = self.get_cache(wp)
+            for log in cache_logs:
+                cache.post_log(log)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # consume the results to raise the first exception, if any
+            list(executor.map(post_cache_logs, logs_by_wp.keys(), logs_by_wp.values()))
+
     def _cache_from_guid(self, guid):
         logging.info('Loading cache with GUID {!r}'.format(guid))
         print_page = self._request(Cache._urls["print_page"], params={"guid": guid})
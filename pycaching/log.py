@@ -2,16 +2,16 @@
 
 import datetime
 import enum
+import functools
 from pycaching import errors
 from pycaching.util import parse_date
 
-# prefix _type() function to avoid colisions with log type
-_type = type
-
 
 class Log(object):
     """Represents a log record with its properties."""
 
+    __slots__ = ("_uuid", "_type", "_text", "_visited", "_author")
+
     def __init__(self, *, uuid=None, type=None, text=None, visited=None, author=None):
         if uuid is not None:
             self.uuid = uuid
@@ -24,6 +24,20 @@ class Log(object):
         if author is not None:
             self.author = author
 
+    @classmethod
+    def _from_logbook_json(cls, data):
+        """Create a log instance from a JSON record returned by logbook endpoint.
+
+        Fields are assigned directly, as the logbook data doesn't need validation.
+        """
+        log = cls()
+        log._uuid = data["LogGuid"]
+        log._type = Type.from_filename(data["LogTypeImage"].rpartition(".")[0])  # filename w/o extension
+        log._text = str(data["LogText"]).strip()
+        log._visited = parse_date(data["Visited"])
+        log._author = data["UserName"].strip()
+        return log
+
     def __str__(self):
         """Return log text."""
         return self.text
@@ -77,12 +91,13 @@ class Log(object):
 
     @visited.setter
     def visited(self, visited):
-        if _type(visited) is str:
-            visited = parse_date(visited)
-        elif _type(visited) is not datetime.date:
+        if isinstance(visited, datetime.date):
+            self._visited = visited
+        elif isinstance(visited, str):
+            self._visited = parse_date(visited)
+        else:
             raise errors.ValueError(
                 "Passed object is not datetime.date instance nor string containing a date.")
-        self._visited = visited
 
     @property
     def author(self):
@@ -132,6 +147,7 @@ class Type(enum.Enum):
     will_attend = "9"
 
     @classmethod
+    @functools.lru_cache(maxsize=None)  # the set of filenames is small and fixed
     def from_filename(cls, filename):
         """Return a log type from its image filename."""
         if filename == "1003":
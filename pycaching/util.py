@@ -55,7 +55,7 @@ def deprecated(func):
 
 def rot13(text):
     """Return a text encoded by rot13 cipher."""
-    return str.translate(text, _rot13codeTable)
+    return text.translate(_rot13codeTable)
 
 
 def parse_date(raw):
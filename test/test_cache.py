@@ -3,7 +3,10 @@ import unittest
 from datetime import date
 from unittest import mock
 
-from pycaching.cache import Cache, Type, Size, Waypoint
+import bs4
+import lxml.html
+
+from pycaching.cache import Cache, Type, Size, Waypoint, WaypointTable
 from pycaching.errors import ValueError as PycachingValueError, LoadError, PMOnlyException
 from pycaching.geo import Point
 from pycaching.geocaching import Geocaching
@@ -38,6 +41,18 @@ class TestProperties(unittest.TestCase):
             with self.assertRaises(PycachingValueError):
                 self.c.wp = "xxx"
 
+        with self.subTest("log page url follows changes"):
+            self.assertEqual(self.c._get_log_page_url(), "play/geocache/gc12345/log")
+            self.c.wp = "GC54321"
+            self.assertEqual(self.c._get_log_page_url(), "play/geocache/gc54321/log")
+
+        with self.subTest("log page kept for the same code"):
+            self.c._log_page = ({"4"}, {})
+            self.c.wp = "GC54321"
+            self.assertEqual(self.c._log_page, ({"4"}, {}))
+            self.c.wp = "GC12345"
+            self.assertIsNone(self.c._log_page)
+
     def test_guid(self):
         self.assertEqual(self.c.guid, "53d34c4d-12b5-4771-86d3-89318f71efb1")
 
@@ -158,6 +173,11 @@ class TestProperties(unittest.TestCase):
             with self.assertRaises(PycachingValueError):
                 self.c.attributes = None
 
+    def test_possible_attributes(self):
+        possible_attributes = Cache.possible_attributes()
+        self.assertEqual(possible_attributes["onehour"], "Takes less than one hour")
+        self.assertEqual(set(possible_attributes), Cache._possible_attribute_keys)
+
     def test_summary(self):
         self.assertEqual(self.c.summary, "text")
 
@@ -205,6 +225,14 @@ class TestMethods(NetworkedTest):
                     cache = Cache(self.gc, "GC3AHDM")
                     cache.load()
 
+        with self.subTest("missing logbook token"):
+            with self.recorder.use_cassette('cache_normal_normal'):
+                with mock.patch("pycaching.cache._USER_TOKEN_RE") as mock_token_re:
+                    mock_token_re.search.return_value = None
+                    with self.assertRaises(LoadError):
+                        cache = Cache(self.gc, "GC4808G")
+                        cache.load()
+
         with self.subTest("fail"):
             with self.recorder.use_cassette('cache_normal_fail'):
                 with self.assertRaises(LoadError):
@@ -286,6 +314,10 @@ class TestMethods(NetworkedTest):
             trackable_list = list(cache.load_trackables(limit=10))
         self.assertTrue(isinstance(trackable_list, list))
 
+        with self.subTest("negative limit"):
+            with self.recorder.use_cassette('cache_trackables'):
+                self.assertEqual([], list(cache.load_trackables(limit=-1)))
+
     def test_load_logbook(self):
         with self.recorder.use_cassette('cache_logbook'):
             # limit over 200 tests pagination
@@ -307,6 +339,22 @@ class TestMethods(NetworkedTest):
             for expected_log in expected_logs:
                 self.assertIn(expected_log, logs)
 
+        with self.subTest("negative limit"):
+            self.assertEqual([], list(self.c.load_logbook(limit=-1)))
+
+        with self.subTest("fractional limit"):
+            log_data = {
+                "LogGuid": "9767f72f-ba69-43ee-affc-44edc0ac8516",
+                "LogTypeImage": "4.png",
+                "LogText": "Note text",
+                "Visited": "2012-02-02",
+                "UserName": "human",
+            }
+            with mock.patch.object(Cache, "_logbook_get_page", return_value=[log_data] * 3) as mock_get_page:
+                logs = list(self.c.load_logbook(limit=2.5))
+            self.assertEqual(2, len(logs))
+            self.assertEqual(1, mock_get_page.call_count)
+
     def test_load_log_page(self):
         expected_types = {t.value for t in (LogType.found_it, LogType.didnt_find_it, LogType.note)}
 
@@ -351,6 +399,19 @@ class TestMethods(NetworkedTest):
             }
             mock_request.assert_called_with(self.c._get_log_page_url(), method="POST", data=expected_post_data)
 
+        with self.subTest("log page reused"):
+            mock_load_log_page.assert_called_once_with()
+
+        with self.subTest("note keeps found status"):
+            self.c.found = True
+            self.c.post_log(Log(text=test_log_text, visited=date.today(), type=LogType.note))
+            self.assertTrue(self.c.found)
+
+        with self.subTest("DNF keeps found status"):
+            self.c.found = True
+            self.c.post_log(Log(text=test_log_text, visited=date.today(), type=LogType.didnt_find_it))
+            self.assertTrue(self.c.found)
+
     def test_cache_types(self):
         with self.subTest("Locationless"):
             with self.recorder.use_cassette('cache_type_locationless'):
@@ -434,3 +495,117 @@ class TestWaypointProperties(unittest.TestCase):
 
     def test_str(self):
         self.assertEqual(str(self.w), "id")
+
+
+class TestWaypointParsing(unittest.TestCase):
+    html = """<html><body><table id="Waypoints">
+        <thead><tr><th></th><th></th><th>Prefix</th><th>Lookup</th><th>Name</th><th>Coordinate</th></tr></thead>
+        <tbody>
+        <tr><td></td><td><img src="/images/WptTypes/sm/pkg.jpg" title="Parking Area"></td><td>PK</td>
+            <td> PARKNG </td><td><a href="#">Parking</a></td><td> N 49° 57.791 E 008° 13.310 </td></tr>
+        <tr><td></td><td>Note:</td><td colspan="6"> Park <b>here</b>. </td></tr>
+        <tr><td></td><td><img src="/images/WptTypes/sm/flag.jpg" title="Final Location"></td><td>FN</td>
+            <td> FINAL </td><td><a href="#">Final</a></td><td> ??? </td></tr>
+        <tr><td></td><td>Note:</td><td colspan="6"></td></tr>
+        </tbody></table></body></html>"""
+
+    def check_waypoints(self, waypoints):
+        self.assertEqual(set(waypoints), {"PARKNG", "FINAL"})
+        self.assertEqual(waypoints["PARKNG"].type, "Parking Area")
+        self.assertEqual(waypoints["PARKNG"].location, Point("N 49° 57.791 E 008° 13.310"))
+        self.assertEqual(waypoints["PARKNG"].note, "Park here.")
+        self.assertIsNone(waypoints["FINAL"].location)
+        self.assertEqual(waypoints["FINAL"].note, "")
+
+    def test_from_html(self):
+        self.check_waypoints(Waypoint.from_html(bs4.BeautifulSoup(self.html, "lxml"), "Waypoints"))
+
+    def test_from_html_nested_type_image(self):
+        html = self.html.replace('<img src="/images/WptTypes/sm/pkg.jpg" title="Parking Area">',
+                                 '<span><img src="/images/WptTypes/sm/pkg.jpg" title="Parking Area"></span>')
+        self.check_waypoints(Waypoint.from_html(bs4.BeautifulSoup(html, "lxml"), "Waypoints"))
+
+    def test_from_html_missing_type_image(self):
+        html = self.html.replace('<img src="/images/WptTypes/sm/pkg.jpg" title="Parking Area">', '')
+        with self.assertRaises(LoadError):
+            Waypoint.from_html(bs4.BeautifulSoup(html, "lxml"), "Waypoints")
+
+    def test_from_html_type_image_without_title(self):
+        html = self.html.replace(' title="Parking Area"', '')
+        waypoints = Waypoint.from_html(bs4.BeautifulSoup(html, "lxml"), "Waypoints")
+        self.assertIsNone(waypoints["PARKNG"].type)
+        self.assertEqual(waypoints["FINAL"].type, "Final Location")
+
+    def test_from_lxml(self):
+        self.check_waypoints(Waypoint.from_lxml(lxml.html.fromstring(self.html), "Waypoints"))
+
+    def test_from_lxml_missing_type_image(self):
+        html = self.html.replace('<img src="/images/WptTypes/sm/pkg.jpg" title="Parking Area">', '')
+        with self.assertRaises(LoadError):
+            Waypoint.from_lxml(lxml.html.fromstring(html), "Waypoints")
+
+    def test_from_lxml_type_image_without_title(self):
+        html = self.html.replace(' title="Parking Area"', '')
+        waypoints = Waypoint.from_lxml(lxml.html.fromstring(html), "Waypoints")
+        self.assertIsNone(waypoints["PARKNG"].type)
+        self.assertEqual(waypoints["FINAL"].type, "Final Location")
+
+    def test_from_html_table(self):
+        table = Waypoint.from_html_table(bs4.BeautifulSoup(self.html, "lxml"), "Waypoints")
+        self.assertEqual(table.ids, ["PARKNG", "FINAL"])
+        self.check_waypoints({w.identifier: w for w in table})
+
+
+class TestWaypointTable(unittest.TestCase):
+    def setUp(self):
+        self.t = WaypointTable()
+        self.t.append("id", "Parking", Point("N 56° 50.006′ E 13° 56.423′"), "This is a test")
+        self.t.append("id2", "Final", None, "")
+
+    def test_len(self):
+        self.assertEqual(len(self.t), 2)
+
+    def test_columns(self):
+        self.assertEqual(self.t.ids, ["id", "id2"])
+        self.assertAlmostEqual(self.t.lats[0], 56.83343, places=5)
+        self.assertNotEqual(self.t.lons[1], self.t.lons[1])  # NaN
+
+    def test_getitem(self):
+        w = self.t[0]
+        self.assertEqual(w.identifier, "id")
+        self.assertEqual(w.type, "Parking")
+        self.assertEqual(w.location, Point("N 56° 50.006′ E 13° 56.423′"))
+        self.assertEqual(w.note, "This is a test")
+        self.assertIsNone(self.t[1].location)
+
+        with self.subTest("slice"):
+            with self.assertRaises(TypeError):
+                self.t[0:1]
+
+    def test_iter(self):
+        self.assertEqual([w.identifier for w in self.t], ["id", "id2"])
+
+
+class TestType(unittest.TestCase):
+
+    def test_from_filename(self):
+        with self.subTest("valid types"):
+            self.assertEqual(Type.traditional, Type.from_filename("2"))
+            self.assertEqual(Type.mystery, Type.from_filename("8"))
+
+        with self.subTest("special valid types"):
+            self.assertEqual(Type.project_ape, Type.from_filename("ape_32"))
+            self.assertEqual(Type.giga_event, Type.from_filename("giga"))
+
+        with self.subTest("invalid type"):
+            with self.assertRaises(PycachingValueError):
+                Type.from_filename("6666")
+
+    def test_from_number(self):
+        with self.subTest("valid types"):
+            self.assertEqual(Type.traditional, Type.from_number(2))
+            self.assertEqual(Type.giga_event, Type.from_number("7005"))
+
+        with self.subTest("invalid type"):
+            with self.assertRaises(PycachingValueError):
+                Type.from_number(6666)
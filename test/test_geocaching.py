@@ -4,6 +4,7 @@ import itertools
 import json
 import os
 import unittest
+from datetime import date
 from subprocess import CalledProcessError
 from tempfile import NamedTemporaryFile
 from unittest.mock import patch
@@ -14,6 +15,7 @@ import pycaching
 from pycaching import Cache, Geocaching, Point, Rectangle
 from pycaching.errors import NotLoggedInException, LoginFailedException, PMOnlyException, TooManyRequestsError
 from pycaching.geocaching import SortOrder
+from pycaching.log import Log, Type as LogType
 from . import username as _username, password as _password, NetworkedTest
 
 
@@ -490,3 +492,21 @@ class TestShortcuts(NetworkedTest):
     def test_post_log(self):
         # I refuse to write 30 lines of tests (mocking etc.) because of 4 simple lines of code.
         pass
+
+    def test_post_logs(self):
+        logs = [
+            ("GC1PAR2", Log(type=LogType.note, text="first", visited=date(2020, 1, 1))),
+            ("GC4808G", Log(type=LogType.note, text="second", visited=date(2020, 1, 1))),
+            ("GC1PAR2", Log(type=LogType.note, text="third", visited=date(2020, 1, 1))),
+        ]
+        with patch.object(Cache, "_load_log_page", autospec=True, return_value=({"4"}, {})) as mock_load_log_page, \
+                patch.object(Geocaching, "_request") as mock_request:
+            self.gc.post_logs(logs)
+
+        with self.subTest("log page loaded once per cache"):
+            self.assertCountEqual(["GC1PAR2", "GC4808G"], [c[0][0].wp for c in mock_load_log_page.call_args_list])
+
+        with self.subTest("logs for the same cache posted in order"):
+            posted = [c[1]["data"]["LogText"] for c in mock_request.call_args_list
+                      if c[0][0] == "play/geocache/gc1par2/log"]
+            self.assertEqual(["first", "third"], posted)
@@ -11,6 +11,20 @@ class TestLog(unittest.TestCase):
     def setUp(self):
         self.l = Log(type=Type.found_it, text="text", visited="2012-02-02", author="human")
 
+    def test__from_logbook_json(self):
+        l = Log._from_logbook_json({
+            "LogGuid": "9767f72f-ba69-43ee-affc-44edc0ac8516",
+            "LogTypeImage": "4.png",
+            "LogText": " Note text ",
+            "Visited": "2012-02-02",
+            "UserName": "human ",
+        })
+        self.assertEqual(l.uuid, "9767f72f-ba69-43ee-affc-44edc0ac8516")
+        self.assertEqual(l.type, Type.note)
+        self.assertEqual(l.text, "Note text")
+        self.assertEqual(l.visited, date(2012, 2, 2))
+        self.assertEqual(l.author, "human")
+
     def test___str__(self):
         self.assertEqual(str(self.l), "text")
 